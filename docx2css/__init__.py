@@ -1,12 +1,49 @@
-from docx2css.css.serializers import CssStylesheetSerializer
+import copy
+from functools import lru_cache
+import os
+
 from docx2css.ooxml.parsers import DocxParser
 
 
 def open_docx(filename):
+    """Parse the docx file and return its Stylesheet.
+
+    Stylesheets are cached on the path, modification time and size of
+    the file, so opening an unchanged file again doesn't parse it twice.
+    Each call returns its own copy of the cached stylesheet, so that
+    changing it doesn't affect the other callers.
+    """
+    try:
+        path = os.path.realpath(filename)
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        # Missing files and file-like objects aren't cached
+        return _parse_docx(filename)
+    stylesheet = _open_cached_docx(path, stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(stylesheet)
+
+
+@lru_cache(maxsize=32)
+def _open_cached_docx(path, mtime_ns, size):
+    return _parse_docx(path)
+
+
+def _parse_docx(filename):
     parser = DocxParser(filename)
     return parser.parse()
 
 
 def to_string(stylesheet):
+    # cssutils is slow to import, only load it when serializing
+    from docx2css.css.serializers import CssStylesheetSerializer
     serializer = CssStylesheetSerializer(stylesheet)
     return serializer.serialize()
+
+
+def __getattr__(name):
+    # Keep the serializer importable from the package without loading
+    # cssutils until it is used
+    if name == 'CssStylesheetSerializer':
+        from docx2css.css.serializers import CssStylesheetSerializer
+        return CssStylesheetSerializer
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,11 +1,36 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, fields
-from typing import Optional
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from typing import Optional, Sequence
 
 from docx2css.utils import CssUnit
 
 
-@dataclass
+class _Fields:
+    """Fixed, ordered list of dataclass field names"""
+    __slots__ = ('names',)
+
+    def __init__(self, names):
+        self.names = tuple(names)
+
+    @classmethod
+    def sorted(cls, dataclass):
+        """Fields of the dataclass sorted alphabetically"""
+        return cls(sorted(dataclass.__dataclass_fields__))
+
+    def items(self, obj, active=False):
+        """Return the list of (name, value) pairs of the object. If
+        active is True, the fields whose value is None are skipped.
+        """
+        if active:
+            # Most fields are None, build the list in a single pass
+            # rather than testing each field in a generator
+            return [(name, value) for name in self.names
+                    if (value := getattr(obj, name)) is not None]
+        return [(name, getattr(obj, name)) for name in self.names]
+
+
+@dataclass(frozen=True, slots=True)
 class Border:
     color: Optional[str] = None
     """Get the optional color of the border taking in consideration
@@ -42,26 +67,43 @@ class Border:
     width: Optional[CssUnit] = None
     """Get the width of the border"""
 
+    @classmethod
+    @lru_cache(maxsize=256, typed=True)
+    def get(cls, color=None, padding=None, shadow=None, style=None, width=None):
+        """Return a shared instance for these border properties.
 
-@dataclass
+        Documents only use a handful of distinct borders, so the
+        instances are cached instead of creating one per style. The
+        cache is typed since the CssUnit subclasses compare equal.
+        """
+        return cls(color, padding, shadow, style, width)
+
+
+UNDERLINE = 1
+LINE_THROUGH = 2
+
+
+@dataclass(frozen=True, slots=True)
 class TextDecoration:
-    UNDERLINE = 1
-    LINE_THROUGH = 2
+    UNDERLINE = UNDERLINE
+    LINE_THROUGH = LINE_THROUGH
     line: int = 0
     color: Optional[str] = None
     style: Optional[str] = None
 
-    def add_line(self, line_type):
-        self.line ^= line_type
+    def with_line(self, line_type):
+        """Return a copy of this decoration with the line type added"""
+        return replace(self, line=self.line | line_type)
 
-    def del_line(self, line_type):
-        self.line &= ~line_type
+    def without_line(self, line_type):
+        """Return a copy of this decoration with the line type removed"""
+        return replace(self, line=self.line & ~line_type)
 
     def has_line(self, line_type):
         return self.line & line_type == line_type
 
 
-@dataclass
+@dataclass(slots=True)
 class TextFormatting:
     all_caps: Optional[bool] = None
     """Specifies that any lowercase characters in this text run shall be
@@ -214,12 +256,7 @@ class TextFormatting:
     """
 
     def text_properties(self, active=False):
-        for f in sorted(fields(TextFormatting), key=lambda x: x.name):
-            value = getattr(self, f.name)
-            if active and value is None:
-                continue
-            else:
-                yield f.name, value
+        return _TEXT_FIELDS.items(self, active)
 
     # Not implemented:
     #   * bCs (Complex Script Bold) §2.3.2.2
@@ -242,7 +279,10 @@ class TextFormatting:
     #   * webHidden (Web Hidden Text) §2.3.2.42
 
 
-@dataclass
+_TEXT_FIELDS = _Fields.sorted(TextFormatting)
+
+
+@dataclass(slots=True)
 class ParagraphFormatting(TextFormatting):
     border_bottom: Border = None
     border_left: Border = None
@@ -290,15 +330,10 @@ class ParagraphFormatting(TextFormatting):
     """
 
     def paragraph_properties(self, active=False, with_text_fields=True):
-        all_fields = set(fields(ParagraphFormatting))
-        if not with_text_fields:
-            all_fields -= set(fields(TextFormatting))
-        for f in sorted(all_fields, key=lambda x: x.name):
-            value = getattr(self, f.name)
-            if active and value is None:
-                continue
-            else:
-                yield f.name, value
+        if with_text_fields:
+            return _PARAGRAPH_FIELDS.items(self, active)
+        else:
+            return _PARAGRAPH_ONLY_FIELDS.items(self, active)
 
     # adjustRightInd (Automatically Adjust Right Indent When Using Document Grid) §2.3.1.1
     # autoSpaceDE (Automatically Adjust Spacing of Latin and East Asian Text) §2.3.1.2
@@ -338,8 +373,17 @@ class ParagraphFormatting(TextFormatting):
     # wordWrap (Allow Line Breaking At Character Level) §2.3.1.45
 
 
+_PARAGRAPH_FIELDS = _Fields.sorted(ParagraphFormatting)
+_PARAGRAPH_ONLY_FIELDS = _Fields(
+    name for name in _PARAGRAPH_FIELDS.names if name not in _TEXT_FIELDS.names
+)
+
+
 @dataclass
 class TableProperties:
+    # Only used as a mixin; the slots are provided by the subclasses
+    __slots__ = ()
+
     alignment: Optional[str] = None
     """Specifies the alignment of the current table with respect to the 
     text margins. When the table does not have the same width as the 
@@ -439,7 +483,7 @@ class TableProperties:
     #   * table floating positioning
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRowProperties:
     alignment: Optional[str] = None
     """Specifies the alignment of a single row in the parent table with 
@@ -493,12 +537,7 @@ class TableRowProperties:
     """Specifies the minimum height of the rows"""
 
     def table_row_properties(self, active=False):
-        for f in sorted(fields(TableRowProperties), key=lambda x: x.name):
-            value = getattr(self, f.name)
-            if active and value is None:
-                continue
-            else:
-                yield f.name, value
+        return _TABLE_ROW_FIELDS.items(self, active)
 
     # Not implemented:
     #   * cnfStyle (Table Row Conditional Formatting) §2.4.8
@@ -513,7 +552,10 @@ class TableRowProperties:
     #   * wBefore (Preferred Width Before Table Row)
 
 
-@dataclass
+_TABLE_ROW_FIELDS = _Fields.sorted(TableRowProperties)
+
+
+@dataclass(slots=True)
 class TableCellProperties:
     background_color: Optional[str] = None
     """Specifies the default background color of the table cells.
@@ -564,12 +606,7 @@ class TableCellProperties:
     """
 
     def table_cell_properties(self, active=False):
-        for f in sorted(fields(TableCellProperties), key=lambda x: x.name):
-            value = getattr(self, f.name)
-            if active and value is None:
-                continue
-            else:
-                yield f.name, value
+        return _TABLE_CELL_FIELDS.items(self, active)
 
     # Not implemented:
     #   * cellDel (Table Cell Deletion) §2.13.5.1
@@ -583,63 +620,91 @@ class TableCellProperties:
     #   * vMerge (Vertically Merged Cell) §2.4.81
 
 
+_TABLE_CELL_FIELDS = _Fields.sorted(TableCellProperties)
+
+
+@lru_cache(maxsize=1024)
+def _qualify(style_type, value):
+    """Return the value prefixed by the style type, eg. 'p.heading1'"""
+    if style_type and value:
+        return f'{style_type}.{value}'
+    return style_type or value or ''
+
+
 class BodyStyle(ParagraphFormatting):
+    __slots__ = ()
     type = 'body'
 
 
 @dataclass
 class BaseStyle(ABC):
+    # Only used as a mixin; the slots are provided by the subclasses
+    __slots__ = ()
 
     name: str
     id: str
     parent: 'BaseStyle' = None
     parent_id: str = None
-    children: list = field(default_factory=list)
+    children: Sequence['BaseStyle'] = ()
+    """Styles based on this style. Most styles are leaves, so the list
+    is only created when the first child is added.
+    """
 
     @property
     @abstractmethod
     def type(self):
         pass
 
+    def add_child(self, style: 'BaseStyle'):
+        if isinstance(self.children, list):
+            self.children.append(style)
+        else:
+            self.children = [*self.children, style]
+
     @property
     def qualified_id(self):
-        return '.'.join(filter(lambda x: x, (self.type, self.id)))
+        return _qualify(self.type, self.id)
 
     @property
     def qualified_name(self):
-        return '.'.join(filter(lambda x: x, (self.type, self.name)))
+        return _qualify(self.type, self.name)
 
     @property
     def qualified_parent_id(self):
-        return '.'.join(filter(lambda x: x, (self.type, self.parent_id)))
+        return _qualify(self.type, self.parent_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class SpanStyle(TextFormatting, BaseStyle):
     type = 'span'
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphStyle(ParagraphFormatting, BaseStyle):
     type = 'p'
 
 
-@dataclass
+@dataclass(slots=True)
 class TableConditionalFormatting(ParagraphFormatting, TableProperties):
     default_cell: TableCellProperties = None
     default_row: TableRowProperties = None
 
     def table_properties(self, active=True):
-        exclude = ('name', 'id', 'parent', 'parent_id', 'children', 'type')
-        for f in fields(TableConditionalFormatting):
-            value = getattr(self, f.name)
-            if f.name in exclude or active and value is None:
-                continue
-            else:
-                yield f.name, value
+        return _TABLE_FIELDS.items(self, active)
 
 
-@dataclass
+# Unlike the other iterators, the table properties keep the field
+# definition order
+_TABLE_FIELD_EXCLUDE = frozenset(
+    ('name', 'id', 'parent', 'parent_id', 'children', 'type')
+)
+_TABLE_FIELDS = _Fields(
+    f.name for f in fields(TableConditionalFormatting)
+    if f.name not in _TABLE_FIELD_EXCLUDE
+)
+
+
+@dataclass(slots=True)
 class TableStyle(TableConditionalFormatting, BaseStyle):
     type = 'table'
     # conditional formatting:
@@ -658,37 +723,34 @@ class TableStyle(TableConditionalFormatting, BaseStyle):
     bottom_right_cell: Optional[TableConditionalFormatting] = None
 
     def table_conditional_formatting_properties(self, active=True):
-        all_fields = (
-            'whole_table',
-            'odd_columns',
-            'even_columns',
-            'odd_rows',
-            'even_rows',
-            'first_row',
-            'last_row',
-            'first_column',
-            'last_column',
-            'top_left_cell',
-            'top_right_cell',
-            'bottom_left_cell',
-            'bottom_right_cell',
-        )
-        for f in fields(self):
-            value = getattr(self, f.name)
-            if f.name not in all_fields or active and value is None:
-                continue
-            else:
-                yield f.name, value
-
-
-@dataclass
+        return _CONDITIONAL_FORMATTING_FIELDS.items(self, active)
+
+
+_CONDITIONAL_FORMATTING_FIELDS = _Fields((
+    'whole_table',
+    'odd_columns',
+    'even_columns',
+    'odd_rows',
+    'even_rows',
+    'first_row',
+    'last_row',
+    'first_column',
+    'last_column',
+    'top_left_cell',
+    'top_right_cell',
+    'bottom_left_cell',
+    'bottom_right_cell',
+))
+
+
+@dataclass(slots=True)
 class CounterList:
     id: str
     name: str
     counters: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Counter(ParagraphFormatting):
     counter_list: CounterList = None
     name: str = None
@@ -696,8 +758,8 @@ class Counter(ParagraphFormatting):
     start: int = 0
     text: str = None
 
-    restart: set = field(default_factory=set)
-    """Levels that are restarted at this level"""
+    restart: frozenset = frozenset()
+    """Names of the counters that are restarted at this level"""
 
     suffix: str = 'tab'
     """Specifies whether the contents should have 'nothing', a 'tab' or
@@ -706,8 +768,11 @@ class Counter(ParagraphFormatting):
 
     justification: str = None
 
+    def add_restart(self, counter_name):
+        self.restart = self.restart | {counter_name}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PageStyle:
     type = 'page'
     margin_left: Optional[CssUnit] = None
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod, ABCMeta
+from dataclasses import replace
+from functools import cached_property, lru_cache
+from itertools import chain
 import re
 
 import cssutils
@@ -9,9 +12,73 @@ from docx2css.utils import (
     AutoLength,
     CssUnit,
     Percentage,
+    css_string,
 )
 
 
+# The same lengths are used over and over again in a document, their CSS
+# values are only formatted once. The cache is typed because the units
+# compare equal to plain integers.
+@lru_cache(maxsize=2048, typed=True)
+def _css_pt(length):
+    return f'{length.pt}pt'
+
+
+@lru_cache(maxsize=2048, typed=True)
+def _css_pt_2f(length):
+    return f'{length.pt:.2f}pt'
+
+
+@lru_cache(maxsize=2048, typed=True)
+def _css_inches(length):
+    return f'{length.inches:.2f}in'
+
+
+@lru_cache(maxsize=2048, typed=True)
+def _css_pct(length):
+    return f'{length.pct:.2f}%'
+
+
+@lru_cache(maxsize=256)
+def _css_counter_resets(counter_names):
+    return ' '.join(sorted(counter_names))
+
+
+class CssDeclaration(dict):
+    """Ordered mapping of CSS property names to their values.
+
+    It is used instead of cssutils.css.CSSStyleDeclaration while the
+    rules are built, so that the values are only parsed once, when the
+    stylesheet is serialized. Like the cssutils declaration, a missing
+    property reads as an empty string and setting a property to an empty
+    value removes it.
+    """
+    __slots__ = ()
+
+    def __missing__(self, name):
+        return ''
+
+    def __setitem__(self, name, value):
+        if value:
+            dict.__setitem__(self, name, value)
+        else:
+            self.pop(name, None)
+
+    def prepend(self, *properties):
+        """Set the (name, value) properties before the existing ones. A
+        property that is already set keeps its value, but is moved first.
+        """
+        existing = dict(self)
+        self.clear()
+        for name, value in properties:
+            self[name] = value
+        self.update(existing)
+
+    @property
+    def css_text(self):
+        return '; '.join(f'{k}: {v}' for k, v in self.items())
+
+
 class CssPropertySerializer(ABC):
 
     def __init__(self, block_serializer: 'CssBlockSerializer', property_value):
@@ -19,7 +86,7 @@ class CssPropertySerializer(ABC):
         self.property_value = property_value
 
     @abstractmethod
-    def set_css_style(self, style_rule: cssutils.css.CSSStyleDeclaration):
+    def set_css_style(self, style_rule: CssDeclaration):
         pass
 
 
@@ -55,6 +122,16 @@ class CssSerializerFactory:
             raise ValueError(f'No serializer registered for "{prop_name}"')
         return creator(style_serializer, prop_value)
 
+    def serialize_property(self, style_serializer, prop_name, prop_value,
+                           css_style):
+        """Set the CSS style of a single property in the declaration"""
+        creator = self.property_serializers.get(prop_name)
+        if not creator:
+            raise ValueError(f'No serializer registered for "{prop_name}"')
+        # No need to create a serializer that doesn't do anything
+        if creator is not NoopSerializer:
+            creator(style_serializer, prop_value).set_css_style(css_style)
+
 
 ########################################################################
 #                                                                      #
@@ -88,18 +165,21 @@ class ToggleMixin(CssPropertySerializer, ABC):
 
 
 class ComplexToggleMixin(ToggleMixin, ABC):
+    """Toggle that may set several CSS properties. The css_name, css_true
+    and css_false values are tuples; the subclasses may define constant
+    strings instead, they are wrapped in tuples once per class.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attribute in ('css_name', 'css_true', 'css_false'):
+            value = cls.__dict__.get(attribute)
+            if isinstance(value, str):
+                setattr(cls, attribute, (value,))
 
     def set_css_style(self, style_rule):
-        css_name = self.css_name
-        if isinstance(css_name, str):
-            css_name = (css_name,)
-        css_true = self.css_true
-        if isinstance(css_true, str):
-            css_true = (css_true,)
-        css_false = self.css_false
-        if isinstance(css_false, str):
-            css_false = (css_false,)
-        for name, value, none_value in zip(css_name, css_true, css_false):
+        css_names = zip(self.css_name, self.css_true, self.css_false)
+        for name, value, none_value in css_names:
             existing = style_rule[name]
             # existing = style_rule.getPropertyValue(name)
             new_value = value if self.property_value else none_value
@@ -135,11 +215,10 @@ class AllCapsSerializer(ToggleMixin):
 class BackgroundColorSerializer(CssPropertySerializer):
 
     def set_css_style(self, style_rule):
-        existing = style_rule['background-color']
-        style_rule['background-color'] = self.property_value
         # It's important to check that the CSS property does not already have
         # a value. If there is one already, leave it alone, unless it's the
         # none value
+        existing = style_rule['background-color']
         if not existing or existing == 'unset':
             style_rule['background-color'] = self.property_value or 'unset'
 
@@ -195,7 +274,7 @@ class FontKerningSerializer(ToggleMixin):
 class FontSizeSerializer(CssPropertySerializer):
 
     def set_css_style(self, style_rule):
-        style_rule['font-size'] = f'{self.property_value.pt}pt'
+        style_rule['font-size'] = _css_pt(self.property_value)
 
 
 class HighlightSerializer(CssPropertySerializer):
@@ -222,7 +301,7 @@ class ItalicsSerializer(ToggleMixin):
 class LetterSpacingSerializer(CssPropertySerializer):
 
     def set_css_style(self, style_rule):
-        style_rule['letter-spacing'] = f'{self.property_value.pt}pt'
+        style_rule['letter-spacing'] = _css_pt(self.property_value)
 
 
 class OutlineSerializer(ComplexToggleMixin):
@@ -246,7 +325,7 @@ class PositionSerializer(ComplexToggleMixin):
 
     @property
     def css_true(self):
-        return f'{self.property_value.pt}pt'
+        return _css_pt(self.property_value),
 
 
 class ShadowSerializer(ComplexToggleMixin):
@@ -293,7 +372,7 @@ class UnderlineSerializer(ComplexToggleMixin):
 
     @property
     def css_true(self):
-        has_underline = self.property_value.has_line(api.TextDecoration.UNDERLINE)
+        has_underline = self.property_value.has_line(api.UNDERLINE)
         return (
             'underline' if has_underline else 'none',
             self.property_value.style if has_underline else '',
@@ -366,6 +445,8 @@ class BreakInsideSerializer(ToggleMixin):
 
 
 class CounterSerializer(CssPropertySerializer):
+    # Reference to a counter in the text of a level, eg. "{name-L1}"
+    counter_reference_regex = re.compile(r'{([^}]*)}')
 
     def css_counter(self, counter=None):
         if counter is None:
@@ -385,68 +466,90 @@ class CounterSerializer(CssPropertySerializer):
             # character in the level_text string, and it might not be
             # printable. Therefore, it is best to escape it
             return fr'"\005C {ord(counter.text):04x}"'
-        contents = []
-        tokens = re.split(r'({.*?})', counter.text)
-        for token in (t for t in tokens if t):
-            regex = re.match(r'{(.*?)}', token)
-            if regex:
-                c = counter.counter_list.counters[regex.group(1)]
-                contents.append(self.css_counter(c))
-            else:
-                contents.append(f'"{token}"')
+        text = counter.text
+        # Most levels are either plain text or a single counter reference
+        if '{' not in text:
+            contents = [css_string(text)] if text else []
+        elif text[0] == '{' and text.find('}') == len(text) - 1:
+            c = counter.counter_list.counters[text[1:-1]]
+            css_counter = self.css_counter(c)
+            contents = [css_counter] if css_counter is not None else []
+        else:
+            contents = self._css_counter_content_tokens(text)
         if counter.suffix == 'space':
             contents.append(r'"\005C 00A0"')
-        return ' '.join(filter(lambda x: x is not None, contents))
+        return ' '.join(contents)
+
+    def _css_counter_content_tokens(self, text):
+        """Get the CSS contents of a level text mixing literal text and
+        counter references
+        """
+        contents = []
+        counters = self.property_value.counter_list.counters
+        end = 0
+        for match in self.counter_reference_regex.finditer(text):
+            start = match.start()
+            if start > end:
+                contents.append(css_string(text[end:start]))
+            css_counter = self.css_counter(counters[match.group(1)])
+            if css_counter is not None:
+                contents.append(css_counter)
+            end = match.end()
+        if end < len(text):
+            contents.append(css_string(text[end:]))
+        return contents
 
     def css_counter_resets(self):
         """
         Get a space-separated list of counters to reset at this level
         :return: String
         """
-        return ' '.join(sorted(self.property_value.restart))
+        # frozenset() returns its argument when it already is a frozenset
+        return _css_counter_resets(frozenset(self.property_value.restart))
 
     def handle_margin_left(self, css_style_before, css_style):
         counter = self.property_value
         paragraph = self.serializer.style
-        margins = (paragraph.indent_left, counter.indent_left)
-        paragraph_margin_left = next((x for x in margins if x is not None), None)
+        paragraph_margin_left = paragraph.indent_left
+        if paragraph_margin_left is None:
+            paragraph_margin_left = counter.indent_left
         if paragraph_margin_left is not None:
-            css_style['margin-left'] = f'{paragraph_margin_left.inches:.2f}in'
+            css_style['margin-left'] = _css_inches(paragraph_margin_left)
 
     def handle_text_indent(self, css_style_before, css_style):
         counter = self.property_value
         paragraph = self.serializer.style
-        indents = (paragraph.text_indent, counter.text_indent)
-        text_indent = next((x for x in indents if x is not None), None)
+        text_indent = paragraph.text_indent
+        if text_indent is None:
+            text_indent = counter.text_indent
         if text_indent is None:
             return
-        css_style_before['text-indent'] = f'{text_indent.inches:.2f}in'
+        css_style_before['text-indent'] = _css_inches(text_indent)
         css_style_before['margin-left'] = ''
         if text_indent < 0:
             if counter.suffix == 'tab':
                 css_style['text-indent'] = ''
                 css_style_before['display'] = 'inline-block'
             else:
-                css_style['text-indent'] = f'{text_indent.inches:.2f}in'
+                css_style['text-indent'] = _css_inches(text_indent)
                 css_style_before['text-indent'] = ''
         else:
             if counter.suffix == 'tab':
                 css_style['text-indent'] = ''
-                css_style_before['margin-right'] = f'{text_indent.inches:.2f}in'
+                css_style_before['margin-right'] = _css_inches(text_indent)
                 css_style_before['display'] = 'inline-block'
             else:
                 css_style['text-indent'] = ''
                 css_style_before['display'] = 'inline-block'
 
     def serialize_properties(self, css_style, properties):
+        serialize_property = self.serializer.factory.serialize_property
         for k, v in properties:
             if k == 'counter':
                 continue
-            factory = self.serializer.factory
-            serializer = factory.get_property_serializer(self.serializer, k, v)
-            serializer.set_css_style(css_style)
+            serialize_property(self.serializer, k, v, css_style)
 
-    def set_css_style_before(self, css_style: cssutils.css.CSSStyleDeclaration):
+    def set_css_style_before(self, css_style: CssDeclaration):
         text_fields = self.property_value.text_properties(True)
         paragraph_style = self.serializer.style
         paragraph_fields = paragraph_style.paragraph_properties(True, False)
@@ -457,7 +560,7 @@ class CounterSerializer(CssPropertySerializer):
         css_style['text-align'] = self.property_value.justification
         return css_style
 
-    def set_css_style(self, style_rule: cssutils.css.CSSStyleDeclaration):
+    def set_css_style(self, style_rule: CssDeclaration):
         before_selector = f'{self.serializer.css_current_selector()}:before'
         before_rule = self.serializer.get_or_create_rule(before_selector)
         self.set_css_style_before(before_rule)
@@ -471,25 +574,31 @@ class LineHeightSerializer(CssPropertySerializer):
     def set_css_style(self, style_rule):
         height = self.property_value
         if isinstance(height, CssUnit):
-            style_rule['line-height'] = f'{height.pt}pt'
+            style_rule['line-height'] = _css_pt(height)
         else:
             style_rule['line-height'] = f'{height:.2f}'
 
 
 class MarginSerializer(CssPropertySerializer):
     direction = ''
+    # CSS property name for the direction, set by __init_subclass__
+    property_name = 'margin'
+    css_length = staticmethod(_css_inches)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        direction = f'-{cls.direction}' if cls.direction else cls.direction
+        cls.property_name = f'margin{direction}'
 
     def value(self):
-        return f'{self.property_value.inches:.2f}in'
+        return self.css_length(self.property_value)
 
     def set_css_style(self, style_rule):
-        style_rule[f'margin-{self.direction}'] = self.value()
+        style_rule[self.property_name] = self.value()
 
 
 class MarginVerticalSerializer(MarginSerializer):
-
-    def value(self):
-        return f'{self.property_value.pt:.2f}pt'
+    css_length = staticmethod(_css_pt_2f)
 
 
 class MarginBottomSerializer(MarginVerticalSerializer):
@@ -517,7 +626,7 @@ class TextAlignSerializer(CssPropertySerializer):
 class TextIndentSerializer(CssPropertySerializer):
 
     def set_css_style(self, style_rule):
-        style_rule['text-indent'] = f'{self.property_value.inches:.2f}in'
+        style_rule['text-indent'] = _css_inches(self.property_value)
 
 
 class WidowsSerializer(ComplexToggleMixin):
@@ -544,6 +653,19 @@ class WidowsSerializer(ComplexToggleMixin):
 
 class BorderSerializer(CssPropertySerializer):
     direction = ''  # Direction (top, left, bottom, right) of the border
+    # CSS property names for the direction, set by __init_subclass__
+    style_property_name = 'border-style'
+    width_property_name = 'border-width'
+    color_property_name = 'border-color'
+    padding_property_name = 'padding'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        direction = f'-{cls.direction}' if cls.direction else cls.direction
+        cls.style_property_name = f'border{direction}-style'
+        cls.width_property_name = f'border{direction}-width'
+        cls.color_property_name = f'border{direction}-color'
+        cls.padding_property_name = f'padding{direction}'
 
     def css_border_shadow(self):
         """Get the value of the box-shadow if the attribute shadow is set to
@@ -557,35 +679,28 @@ class BorderSerializer(CssPropertySerializer):
         """Get the CSS border width. The 'sz' attribute is in 8th of a pt.
         """
         width = self.property_value.width
-        return f'{width.pt:.2f}pt' if width is not None else ''
+        return _css_pt_2f(width) if width is not None else ''
 
     def css_padding(self):
         """
         Add the padding corresponding to space attribute
         """
         padding = self.property_value.padding
-        return f'{padding.pt}pt' if padding else ''
-
-    def set_border_rule(self, style_rule: cssutils.css.CSSStyleDeclaration):
-        direction = f'-{self.direction}' if self.direction else self.direction
-        style_property_name = f'border{direction}-style'
-        width_property_name = f'border{direction}-width'
-        color_property_name = f'border{direction}-color'
-        padding_property_name = f'padding{direction}'
+        return _css_pt(padding) if padding else ''
+
+    def set_border_rule(self, style_rule: CssDeclaration):
         style = self.property_value.style
-        style_rule[style_property_name] = style
+        style_rule[self.style_property_name] = style
         if style != 'none':
-            style_rule[width_property_name] = self.css_border_width()
-            style_rule[color_property_name] = self.property_value.color
-            style_rule[padding_property_name] = self.css_padding()
+            style_rule[self.width_property_name] = self.css_border_width()
+            style_rule[self.color_property_name] = self.property_value.color
+            style_rule[self.padding_property_name] = self.css_padding()
             style_rule['box-shadow'] = self.css_border_shadow()
 
     def set_css_style(self, style_rule):
         # Always collapse the borders at the table level
         if isinstance(self.serializer, CssTableSerializer):
-            table_selector = self.serializer.css_selector()
-            table_css_rule = self.serializer.get_or_create_rule(table_selector)
-            table_css_rule['border-collapse'] = 'collapse'
+            self.serializer.collapse_borders()
         self.set_border_rule(style_rule)
 
 
@@ -597,17 +712,11 @@ class BorderInsideHorizontalSerializer(BorderSerializer, CssTablePropertySeriali
     inside_border_selector_suffix = 'td'
     direction = 'bottom'
 
-    @property
-    def inside_border_selector(self):
-        attr_name = '_inside_border_selector'
-        if not hasattr(self, attr_name):
-            suffix = self.inside_border_selector_suffix
-            setattr(self, attr_name, self.serializer.css_selector(suffix=suffix))
-        return getattr(self, attr_name)
-
-    @inside_border_selector.setter
-    def inside_border_selector(self, selector):
-        setattr(self, '_inside_border_selector', selector)
+    def __init__(self, block_serializer: 'CssTableSerializer', property_value):
+        super().__init__(block_serializer, property_value)
+        # The conditional formattings replace it with their own selector
+        suffix = self.inside_border_selector_suffix
+        self.inside_border_selector = block_serializer.css_selector(suffix=suffix)
 
     def set_inside_border(self):
         selector = self.inside_border_selector
@@ -616,20 +725,9 @@ class BorderInsideHorizontalSerializer(BorderSerializer, CssTablePropertySeriali
 
     def set_css_style(self, style_rule):
         # Inside horizontal border can be set at the default cell level,
-        # therefore, we need to get the table style rule in order to set
-        # the border-collapse and border-style at the table level
-        # instead of the cell
-        table_selector = self.serializer.css_selector()
-        table_rule = self.serializer.get_or_create_rule(table_selector)
-        # Reorder the children of the style rule so that border-style:
-        # hidden will be first
-        current_children = list(table_rule.children())
-        for child in current_children:
-            table_rule.removeProperty(child.name)
-        table_rule['border-collapse'] = 'collapse'
-        table_rule['border-style'] = 'hidden'
-        for child in current_children:
-            table_rule.setProperty(child)
+        # therefore, the border-collapse and border-style must be set at
+        # the table level instead of the cell
+        self.serializer.collapse_borders(hide_outside=True)
         self.set_inside_border()
 
 
@@ -654,7 +752,7 @@ class BorderTopSerializer(BorderSerializer):
 class RowHeightSerializer(CssPropertySerializer):
     
     def set_css_style(self, style_rule):
-        style_rule['height'] = f'{self.property_value.inches:.2f}in'
+        style_rule['height'] = _css_inches(self.property_value)
 
 
 ########################################################################
@@ -695,12 +793,18 @@ class TableAlignmentSerializer(CssPropertySerializer):
 
 class TableCellPaddingSerializer(CssTablePropertySerializer):
     direction = ''  # Direction (top, left, bottom, right) of the border
+    # CSS property name for the direction, set by __init_subclass__
+    padding_property_name = 'padding'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        direction = f'-{cls.direction}' if cls.direction else cls.direction
+        cls.padding_property_name = f'padding{direction}'
 
     def set_css_style(self, style_rule):
         selector = self.serializer.css_selector(suffix='td')
         style_rule = self.serializer.get_or_create_rule(selector)
-        direction = f'-{self.direction}' if self.direction else self.direction
-        style_rule[f'padding{direction}'] = f'{self.property_value.pt}pt'
+        style_rule[self.padding_property_name] = _css_pt(self.property_value)
 
 
 class TableCellPaddingBottomSerializer(TableCellPaddingSerializer):
@@ -748,7 +852,7 @@ class TableCellWrapTextSerializer(CssPropertySerializer):
 class TableIndentSerializer(CssPropertySerializer):
 
     def set_css_style(self, style_rule):
-        style_rule['margin-left'] = f'{self.property_value.inches:.2f}in'
+        style_rule['margin-left'] = _css_inches(self.property_value)
 
 
 class TableLayoutSerializer(CssPropertySerializer):
@@ -763,12 +867,23 @@ class TableWidthSerializer(CssPropertySerializer):
         if isinstance(self.property_value, AutoLength):
             style_rule['width'] = 'auto'
         elif isinstance(self.property_value, Percentage):
-            style_rule['width'] = f'{self.property_value.pct:.2f}%'
+            style_rule['width'] = _css_pct(self.property_value)
         else:
-            style_rule['width'] = f'{self.property_value.inches:.2f}in'
+            style_rule['width'] = _css_inches(self.property_value)
 
 
 class TableConditionalFormatting(CssTablePropertySerializer, ABC):
+    # Selector method of each border of the default cell, resolved once
+    # per class by __init_subclass__
+    border_selectors = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.border_selectors = {
+            border: getattr(cls, f'{border}_selector')
+            for border in ('border_bottom', 'border_left', 'border_right',
+                           'border_top')
+        }
 
     @abstractmethod
     def cell_selector(self):
@@ -804,8 +919,7 @@ class TableConditionalFormatting(CssTablePropertySerializer, ABC):
 
     def serialize_single_property(self, prop_tuple, css_rule):
         factory = self.serializer.factory
-        handler = factory.get_property_serializer(self.serializer, *prop_tuple)
-        handler.set_css_style(css_rule)
+        factory.serialize_property(self.serializer, *prop_tuple, css_rule)
 
     def serialize_border_inside_horizontal(self, border_property):
         selector = self.border_inside_horizontal_selector()
@@ -841,14 +955,15 @@ class TableConditionalFormatting(CssTablePropertySerializer, ABC):
             self.serializer.serialize_properties(row_selector, row_properties)
         if default_cell:
             cell_properties = default_cell.table_cell_properties(True)
+            border_selectors = self.border_selectors
             for k, v in cell_properties:
                 if k == 'border_inside_horizontal':
                     self.serialize_border_inside_horizontal(v)
                 elif k == 'border_inside_vertical':
                     self.serialize_border_inside_vertical(v)
-                elif k.startswith('border'):
-                    func = getattr(self, f'{k}_selector')
-                    css_rule = self.serializer.get_or_create_rule(func())
+                elif k in border_selectors:
+                    selector = border_selectors[k](self)
+                    css_rule = self.serializer.get_or_create_rule(selector)
                     self.serialize_single_property((k, v), css_rule)
                 else:
                     self.serialize_single_property((k, v), default_cell_css_rule)
@@ -953,7 +1068,7 @@ class EvenColumnsSerializer(OddColumnsSerializer):
         return self.serializer.even_column_selector(row='tr:first-of-type')
 
     def border_inside_vertical_selector(self):
-        self.serializer.column_inside_vertical_selector(odd=False)
+        return self.serializer.column_inside_vertical_selector(odd=False)
 
 
 class SingleColumnMixin(TableConditionalFormatting, ABC):
@@ -1209,6 +1324,9 @@ FACTORY.register('default_row', NoopSerializer)
 class CssStylesheetSerializer:
     include_media_rules = True
     initialize_counters_in_body = True
+    # Let cssutils parse and format the CSS text. Otherwise, the rules are
+    # written as they are built, one per line, which is a lot faster.
+    normalize_css = True
 
     def __init__(self, stylesheet: Stylesheet, factory: CssSerializerFactory = None):
         self.stylesheet = stylesheet
@@ -1217,28 +1335,51 @@ class CssStylesheetSerializer:
 
     @property
     def css_stylesheet(self):
-        self._css_stylesheet = cssutils.css.CSSStyleSheet()
-        self._serialize_css()
+        self._css_stylesheet = self._parse_css_rules()
         return self._css_stylesheet
 
     def serialize(self):
-        return self.css_stylesheet.cssText.decode('utf-8')
-
-    def _add_rules(self, rule):
-        """Add a set of rules to the CSSStylesheet"""
-        for r in rule:
-            self._css_stylesheet.add(r)
-
-    def _serialize_css(self):
+        """Return the CSS text of all the rules, joined the same way
+        CSSStyleSheet.cssText would, without building the stylesheet.
+        """
+        if not self.normalize_css:
+            return '\n'.join(self.css_rules())
+        rules = self._parse_css_rules().cssRules
+        return '\n'.join(css_text for r in rules if (css_text := r.cssText))
+
+    def _parse_css_rules(self):
+        """Parse the CSS text of the rules into a CSSStyleSheet"""
+        # Parsing all the rules at once is a lot faster than adding them
+        # one by one. Validation only logs warnings about the values and
+        # doesn't change the output.
+        rules = list(self.css_rules())
+        stylesheet = cssutils.parseString('\n'.join(rules), validate=False)
+        if len(stylesheet.cssRules) != len(rules):
+            # A value broke out of its rule and swallowed the following
+            # ones. Parse the rules one by one, so that a bad value can
+            # only spoil its own rule.
+            stylesheet = cssutils.css.CSSStyleSheet(validating=False)
+            for rule in rules:
+                for css_rule in cssutils.parseString(rule, validate=False):
+                    stylesheet.add(css_rule)
+        return stylesheet
+
+    def css_rules(self):
+        """Yield the rules of every style of the stylesheet as CSS text"""
+        # The serializers of the child styles are shared by all the styles
+        # of this pass only
+        child_serializers = {}
         if self.include_media_rules:
-            self.serialize_page_style()
+            yield from self.serialize_page_style()
         body_style = self.stylesheet.body_style
         root_counters = self.css_root_counters()
         if root_counters:
-            body_style.counter = api.Counter(restart=root_counters, text='')
+            # Serialize a copy, the stylesheet itself is left untouched
+            body_style = replace(body_style, counter=api.Counter(
+                restart=frozenset(root_counters), text=''
+            ))
         serializer = self.factory.get_block_serializer(body_style)
-        self._add_rules(serializer.css_style_rules())
-        from itertools import chain
+        yield from serializer.css_text_rules()
         all_styles = chain(
             self.stylesheet.span_styles.values(),
             self.stylesheet.paragraph_styles.values(),
@@ -1247,7 +1388,8 @@ class CssStylesheetSerializer:
         for style in all_styles:
             serializer = self.factory.get_block_serializer(style)
             if serializer is not None:
-                self._add_rules(serializer.css_style_rules())
+                serializer.child_serializers = child_serializers
+                yield from serializer.css_text_rules()
 
     def css_root_counters(self):
         """Return a sorted set of all counters if
@@ -1257,12 +1399,14 @@ class CssStylesheetSerializer:
         all_counters = set()
         restarted_counters = set()
         for style in self.stylesheet.paragraph_styles.values():
-            if hasattr(style, 'counter') and style.counter is not None:
-                counter = style.counter
-                counter_name = counter.name
-                if counter.start != 1:
-                    counter_name += f' {counter.start - 1}'
-                all_counters.add(counter_name)
+            counter = getattr(style, 'counter', None)
+            if counter is None:
+                continue
+            if counter.start != 1:
+                all_counters.add(f'{counter.name} {counter.start - 1}')
+            else:
+                all_counters.add(counter.name)
+            if counter.restart:
                 restarted_counters.update(counter.restart)
         if self.initialize_counters_in_body:
             return all_counters
@@ -1272,7 +1416,7 @@ class CssStylesheetSerializer:
     def serialize_page_style(self):
         page_style = self.stylesheet.page_style
         serializer = self.factory.get_block_serializer(page_style)
-        self._add_rules(serializer.css_style_rules())
+        return serializer.css_text_rules()
 
 
 class CssBlockSerializer(ABC, metaclass=ABCMeta):
@@ -1281,6 +1425,13 @@ class CssBlockSerializer(ABC, metaclass=ABCMeta):
         self.__style_rules = {}
         self.factory = factory
         self.style = style
+        # Serializers of the descendant styles, by id of the style. They
+        # keep a reference to their style, so an id can't be reused while
+        # it is in the dict.
+        self.child_serializers = {}
+        # Selectors by suffix. They are asked for every time the style is
+        # the descendant of another one.
+        self._css_selectors = {}
 
     @property
     @abstractmethod
@@ -1291,10 +1442,22 @@ class CssBlockSerializer(ABC, metaclass=ABCMeta):
     def _serialize(self):
         pass
 
+    def get_child_serializer(self, style):
+        """Get a serializer for a descendant style, shared with the other
+        serializers of the same tree. These serializers are only used to
+        build selectors, they must not serialize their style.
+        """
+        serializer = self.child_serializers.get(id(style))
+        if serializer is None:
+            serializer = self.factory.get_block_serializer(style)
+            serializer.child_serializers = self.child_serializers
+            self.child_serializers[id(style)] = serializer
+        return serializer
+
     def get_or_create_rule(self, selector):
         rule = self.__style_rules.get(selector)
         if rule is None:
-            rule = cssutils.css.CSSStyleDeclaration()
+            rule = CssDeclaration()
             self.__style_rules[selector] = rule
         return rule
 
@@ -1303,9 +1466,9 @@ class CssBlockSerializer(ABC, metaclass=ABCMeta):
         container used as argument
         """
         css_style = self.get_or_create_rule(selector)
-        for prop_tuple in properties:
-            serializer = self.factory.get_property_serializer(self, *prop_tuple)
-            serializer.set_css_style(css_style)
+        serialize_property = self.factory.serialize_property
+        for prop_name, prop_value in properties:
+            serialize_property(self, prop_name, prop_value, css_style)
 
     def css_current_selector(self):
         """Get the selector for the current style only"""
@@ -1315,68 +1478,110 @@ class CssBlockSerializer(ABC, metaclass=ABCMeta):
         """Get the CSS selector for this style, including all the
         children with an optional suffix appended
         """
-        names = [' '.join((self.css_current_selector(), suffix))]
-
-        for child in self.get_style_children():
-            block_serializer = self.factory.get_block_serializer(child)
-            names.append(block_serializer.css_selector(suffix=suffix))
-        return ', '.join(names)
+        selector = self._css_selectors.get(suffix)
+        if selector is None:
+            names = [' '.join((self.css_current_selector(), suffix))]
+            for child in self.get_style_children():
+                block_serializer = self.get_child_serializer(child)
+                names.append(block_serializer.css_selector(suffix=suffix))
+            selector = ', '.join(names)
+            self._css_selectors[suffix] = selector
+        return selector
 
     def get_style_children(self):
         return self.style.children
 
-    def css_style_rules(self):
+    def css_declarations(self):
+        """Serialize the style and return its (selector, declaration)
+        pairs
+        """
         self._serialize()
-        return (cssutils.css.CSSStyleRule(k, style=v)
-                for k, v in self.__style_rules.items())
+        return self.__style_rules.items()
+
+    def css_style_rules(self):
+        return (cssutils.css.CSSStyleRule(k, style=v.css_text)
+                for k, v in self.css_declarations())
+
+    def css_text_rules(self):
+        """Yield the non-empty rules of this style as CSS text"""
+        for selector, declaration in self.css_declarations():
+            if declaration:
+                yield f'{selector} {{{declaration.css_text}}}'
 
 
 class CssPageSerializer(CssBlockSerializer):
     css_selector_prefix = ''
+    include_screen_rules = True
+    # Lengths are written with the .15g format, which drops the trailing
+    # zeros of round values (1in instead of 1.0in). The precision is kept
+    # high enough for cssutils to do the final rounding.
+    css_page_rule_template = (
+        '@page {{size: {width:.15g}in {height:.15g}in; margin: {margin}}}'
+    )
+    css_screen_rule_template = (
+        '@media screen {{body {{'
+        'max-width: {max_width:.15g}in; '
+        'margin: 1em auto; '
+        'padding: {margin}'
+        '}}}}'
+    )
+    # Margin shorthand templates by number of values
+    css_margin_templates = {
+        n: ' '.join(['{:.15g}in'] * n) for n in range(1, 5)
+    }
 
     def __init__(self, style: api.PageStyle, factory: CssSerializerFactory):
         super().__init__(style, factory)
         self.style = style
 
+    @cached_property
     def _css_margin_value(self):
+        # Shared by the print margin and the screen padding
         top = self.style.margin_top.inches
         right = self.style.margin_right.inches
         bottom = self.style.margin_bottom.inches
         left = self.style.margin_left.inches
-        return f'{top}in {right}in {bottom}in {left}in'
-
-    def css_style_declaration_print(self):
-        css_style = cssutils.css.CSSStyleDeclaration()
-        css_style['size'] = (f'{self.style.page_width.inches}in '
-                             f'{self.style.page_height.inches}in')
-        css_style['margin'] = self._css_margin_value()
-        return css_style
+        # Use the shortest equivalent shorthand
+        if left == right:
+            if top == bottom:
+                if top == left:
+                    values = (top,)
+                else:
+                    values = (top, right)
+            else:
+                values = (top, right, bottom)
+        else:
+            values = (top, right, bottom, left)
+        return self.css_margin_templates[len(values)].format(*values)
+
+    def css_page_rule(self):
+        """Return the @page rule as CSS text"""
+        return self.css_page_rule_template.format(
+            width=self.style.page_width.inches,
+            height=self.style.page_height.inches,
+            margin=self._css_margin_value,
+        )
 
-    def css_style_declaration_screen(self):
-        css_style = cssutils.css.CSSStyleDeclaration()
+    def css_style_rule_screen(self):
+        """Return the screen media rule as CSS text"""
         # Adjust max-width to margins
         max_width = self.style.page_width - self.style.margin_left - self.style.margin_right
-        css_style['max-width'] = f'{CssUnit(max_width).inches}in'
-        css_style['margin'] = '1em auto'
-        css_style['padding'] = self._css_margin_value()
-        return css_style
-
-    def css_style_rule_screen(self):
-        screen = cssutils.css.CSSMediaRule('screen')
-        body_style = self.css_style_declaration_screen()
-        body_rule = cssutils.css.CSSStyleRule('body', body_style)
-        screen.add(body_rule)
-        return screen
+        return self.css_screen_rule_template.format(
+            max_width=CssUnit(max_width).inches,
+            margin=self._css_margin_value,
+        )
 
     def _serialize(self):
         pass
 
     def css_style_rules(self):
-        css_style = self.css_style_declaration_print()
-        return (
-            cssutils.css.CSSPageRule(style=css_style),
-            self.css_style_rule_screen()
-        )
+        yield self.css_page_rule()
+        if self.include_screen_rules:
+            yield self.css_style_rule_screen()
+
+    def css_text_rules(self):
+        # The page rules are already written as CSS text
+        return self.css_style_rules()
 
 
 class CssBodySerializer(CssBlockSerializer):
@@ -1410,25 +1615,39 @@ class CssSpanSerializer(CssBlockSerializer):
 
 
 class CssParagraphSerializer(CssBlockSerializer):
+    heading_prefix_regex = re.compile('h[1-6]')
+    heading_name_regex = re.compile('heading([1-6])')
 
     def __init__(self, style: api.ParagraphStyle, factory: CssSerializerFactory):
         super().__init__(style, factory)
         self.style = style
 
-    def css_current_selector(self):
+    @cached_property
+    def _css_current_selector(self):
         class_name = f'{self.style.id}'
         prefix = self.css_selector_prefix
-        if class_name == '' or re.match('h[1-6]', prefix):
+        if class_name == '' or self.heading_prefix_regex.match(prefix):
             return prefix
         else:
-            return f"{self.css_selector_prefix}.{class_name}"
+            return f"{prefix}.{class_name}"
+
+    def css_current_selector(self):
+        return self._css_current_selector
 
     def css_selector(self, suffix=''):
+        # The suffix isn't used for paragraphs
+        selector = self._css_selectors.get('')
+        if selector is None:
+            selector = self._build_css_selector()
+            self._css_selectors[''] = selector
+        return selector
+
+    def _build_css_selector(self):
         current_selector = self.css_current_selector()
         names = [current_selector]
 
         def not_p(s):
-            ser = self.factory.get_block_serializer(s)
+            ser = self.get_child_serializer(s)
             return s.parent_id == '' and not ser.css_selector_prefix == 'p'
 
         # Treat Normal style a bit differently
@@ -1438,14 +1657,14 @@ class CssParagraphSerializer(CssBlockSerializer):
             children = self.style.children
 
         for child in children:
-            serializer = self.factory.get_block_serializer(child)
+            serializer = self.get_child_serializer(child)
             names.append(serializer.css_selector())
         return ', '.join(names)
 
-    @property
+    @cached_property
     def css_selector_prefix(self):
         class_name = ''.join(self.style.name.split())
-        regex = re.match('heading([1-6])', class_name)
+        regex = self.heading_name_regex.match(class_name)
         if regex:
             return f'h{regex.group(1)}'
         return 'p'
@@ -1455,15 +1674,14 @@ class CssParagraphSerializer(CssBlockSerializer):
         # self.serialize_properties(self.css_selector(), self.style)
         css_style = self.get_or_create_rule(self.css_selector())
         counter = None
+        serialize_property = self.factory.serialize_property
         for k, v in self.style.paragraph_properties(active=True):
             if k == 'counter':
                 counter = v
                 continue
-            serializer = self.factory.get_property_serializer(self, k, v)
-            serializer.set_css_style(css_style)
+            serialize_property(self, k, v, css_style)
         if counter:
-            serializer = self.factory.get_property_serializer(self, 'counter', counter)
-            serializer.set_css_style(css_style)
+            serialize_property(self, 'counter', counter, css_style)
 
 
 class CssTableSerializer(CssBlockSerializer):
@@ -1472,10 +1690,51 @@ class CssTableSerializer(CssBlockSerializer):
     def __init__(self, style: api.TableStyle, factory: CssSerializerFactory):
         super().__init__(style, factory)
         self.style = style
+        # The conditional formatting asks for the same selectors over and
+        # over again, they are only built once per serializer
+        self._col_row_selectors_cache = {}
+        self._band_selectors = {}
+        self._borders_collapsed = False
+        self._outside_borders_hidden = False
+
+    @cached_property
+    def _css_current_selector(self):
+        return self.style.qualified_id
 
     def css_current_selector(self):
         """Get the selector for the current style only"""
-        return self.style.qualified_id
+        return self._css_current_selector
+
+    @cached_property
+    def _current_selectors(self):
+        """Current selector of this style followed by the ones of all its
+        descendants, in the order used by css_selector
+        """
+        selectors = []
+        pending = [self]
+        while pending:
+            serializer = pending.pop()
+            selectors.append(serializer.css_current_selector())
+            children = serializer.get_style_children()
+            pending.extend(
+                self.get_child_serializer(child)
+                for child in reversed(children)
+            )
+        return selectors
+
+    def css_selector(self, suffix=''):
+        selector = self._css_selectors.get(suffix)
+        if selector is None:
+            current_selectors = self._current_selectors
+            if len(current_selectors) == 1:
+                # Most table styles don't have any children
+                selector = ' '.join((current_selectors[0], suffix))
+            else:
+                selector = ', '.join(
+                    [' '.join((s, suffix)) for s in current_selectors]
+                )
+            self._css_selectors[suffix] = selector
+        return selector
 
     def get_style_children(self):
         if self.css_current_selector() == 'table':
@@ -1483,42 +1742,89 @@ class CssTableSerializer(CssBlockSerializer):
         else:
             return self.style.children
 
+    def collapse_borders(self, hide_outside=False):
+        """Collapse the borders in the table style rule and, optionally,
+        hide its outside borders. The table rule is only updated once.
+        """
+        if hide_outside and not self._outside_borders_hidden:
+            table_rule = self.get_or_create_rule(self.css_selector())
+            # border-style: hidden must come before the other properties
+            # of the style rule
+            table_rule.prepend(
+                ('border-collapse', 'collapse'),
+                ('border-style', 'hidden'),
+            )
+            self._borders_collapsed = self._outside_borders_hidden = True
+        elif not self._borders_collapsed:
+            table_rule = self.get_or_create_rule(self.css_selector())
+            table_rule['border-collapse'] = 'collapse'
+            self._borders_collapsed = True
+
     def default_cell_css_selector(self):
         """Get the CSS selector for the default cell"""
         return self.css_selector(suffix='td')
 
     def _col_row_selectors(self, column=True, odd=True, row='tr', suffix=''):
+        key = column, odd, row, suffix
+        selectors = self._col_row_selectors_cache.get(key)
+        if selectors is None:
+            selectors = self._build_col_row_selectors(column, odd, row, suffix)
+            self._col_row_selectors_cache[key] = selectors
+        return selectors
+
+    @cached_property
+    def _col_band_size(self):
+        return self.style.col_band_size or 1
+
+    @cached_property
+    def _row_band_size(self):
+        return self.style.row_band_size or 1
+
+    def _build_col_row_selectors(self, column, odd, row, suffix):
         if column:
-            n = self.style.col_band_size or 1
+            n = self._col_band_size
             element = f'{row} td'
         else:
-            n = self.style.row_band_size or 1
+            n = self._row_band_size
             element = f'{row}'
         bands = 2 * n
-        suffixes = []
         start = 1 if odd else n + 1
         stop = n + 1 if odd else bands + 1
-        for x in range(start, stop):
-            current = ''.join((f'{element}:nth-child({bands}n+{x})', suffix))
-            suffixes.append(self.css_selector(suffix=current))
-        return suffixes
+        template = f'{element}:nth-child({bands}n+{{}})'
+        return tuple(
+            self.css_selector(suffix=template.format(x) + suffix)
+            for x in range(start, stop)
+        )
 
     def column_inside_vertical_selector(self, odd=True):
-        n = self.style.col_band_size or 1
+        key = 'inside_vertical', odd
+        selector = self._band_selectors.get(key)
+        if selector is None:
+            selector = self._build_column_inside_vertical_selector(odd)
+            self._band_selectors[key] = selector
+        return selector
+
+    def _build_column_inside_vertical_selector(self, odd):
+        n = self._col_band_size
         bands = 2 * n
-        suffixes = []
         start = 1 if odd else n + 1
         stop = n if odd else bands
-        for x in range(start, stop):
-            td1 = f'tr td:nth-child({bands}n+{x})'
-            td2 = f'td:nth-child({bands}n+{x + 1})'
-            current = ' + '.join((td1, td2))
-            suffixes.append(self.css_selector(suffix=current))
-        return ', '.join(suffixes)
+        template = (
+            f'tr td:nth-child({bands}n+{{}}) + td:nth-child({bands}n+{{}})'
+        )
+        return ', '.join([
+            self.css_selector(suffix=template.format(x, x + 1))
+            for x in range(start, stop)
+        ])
 
     def col_row_selector(self, column=True, odd=True, row='tr', suffix=''):
-        suffixes = self._col_row_selectors(column, odd, row, suffix)
-        return ', '.join(suffixes)
+        key = column, odd, row, suffix
+        selector = self._band_selectors.get(key)
+        if selector is None:
+            suffixes = self._col_row_selectors(column, odd, row, suffix)
+            selector = ', '.join(suffixes)
+            self._band_selectors[key] = selector
+        return selector
 
     def odd_row_selector(self, suffix=''):
         """Get the CSS selector for odd rows"""
@@ -1561,8 +1867,15 @@ class CssTableSerializer(CssBlockSerializer):
         return self._col_row_selectors(column=False, odd=False)[-1]
 
     def row_inside_horizontal_selector(self, odd=True):
-        suffixes = self._col_row_selectors(column=False, odd=odd, suffix=' td')
-        return ', '.join(suffixes[:-1])
+        key = 'inside_horizontal', odd
+        selector = self._band_selectors.get(key)
+        if selector is None:
+            suffixes = self._col_row_selectors(
+                column=False, odd=odd, suffix=' td'
+            )
+            selector = ', '.join(suffixes[:-1])
+            self._band_selectors[key] = selector
+        return selector
 
     def top_left_cell_selector(self):
         return self.css_selector(suffix='tr:first-of-type td:first-of-type')
@@ -1,26 +1,37 @@
+from functools import lru_cache
+
 from lxml import etree
 
 from .constants import NAMESPACES
 
+STYLE_TAG = f"{{{NAMESPACES['w']}}}style"
+STYLE_TYPE_ATTRIBUTE = f"{{{NAMESPACES['w']}}}type"
+
+
+@lru_cache(maxsize=None)
+def _style_mapping():
+    # The style modules import this package, they can't be imported
+    # before the first lookup
+    from . import styles, tables
+    return {
+        'character': styles.DocxCharacterStyle,
+        'numbering': styles.DocxNumberingStyle,
+        'paragraph': styles.DocxParagraphStyle,
+        'table': tables.DocxTableStyle,
+    }
+
 
 class DocxStyleLookup(etree.PythonElementClassLookup):
 
     def lookup(self, doc, element):
-        from . import styles, tables
-        style_mapping = {
-            'character': styles.DocxCharacterStyle,
-            'numbering': styles.DocxNumberingStyle,
-            'paragraph': styles.DocxParagraphStyle,
-            'table': tables.DocxTableStyle,
-        }
-        style_tag = f"{{{NAMESPACES['w']}}}style"
-        style_type_name = f"{{{NAMESPACES['w']}}}type"
-        if element.tag == style_tag:
-            return style_mapping.get(element.get(style_type_name), None)
+        # Called for every element of the parsed parts
+        if element.tag == STYLE_TAG:
+            return _style_mapping().get(element.get(STYLE_TYPE_ATTRIBUTE))
 
 
 lookup = etree.ElementNamespaceClassLookup()
-opc_parser = etree.XMLParser()
+# IDs are never looked up in docx parts, no need to build an ID table
+opc_parser = etree.XMLParser(collect_ids=False)
 opc_parser.set_element_class_lookup(DocxStyleLookup(lookup))
 drawingml = lookup.get_namespace(NAMESPACES['a'])
 wordml = lookup.get_namespace(NAMESPACES['w'])
@@ -1,7 +1,9 @@
+import re
+
 from docx2css import api
 from docx2css.ooxml import NAMESPACES, normalize_element_name, w
 from docx2css.ooxml.simple_types import ST_Underline, ST_FontFamily
-from docx2css.utils import AutoLength, CssUnit, Percentage
+from docx2css.utils import AutoLength, CssUnit, Percentage, css_string
 
 
 def get_or_create_element(xml_parent, path):
@@ -46,7 +48,7 @@ class BorderDescriptor:
     def __get__(self, instance, owner) -> api.Border:
         element = instance.find(self.path, namespaces=NAMESPACES)
         if element is not None:
-            return api.Border(
+            return api.Border.get(
                 color=element.color,
                 padding=element.padding,
                 shadow=element.shadow,
@@ -164,6 +166,8 @@ class VerticalJustification(String):
 
 
 class FontDescriptor:
+    # Font names that can be written without quotes
+    unquoted_font_regex = re.compile(r'[^ {};,"\'\\\n]*')
 
     def __init__(self, relative_path):
         self.path = relative_path
@@ -187,7 +191,10 @@ class FontDescriptor:
                 font_name = element.get_theme_font_or_font_value(attribute)
                 if font_name:
                     for f in element.get_font_from_font_table(font_name):
-                        fonts[f'"{f}"' if ' ' in f else f] = None
+                        if self.unquoted_font_regex.fullmatch(f):
+                            fonts[f] = None
+                        else:
+                            fonts[css_string(f)] = None
             # Push the generic family at the end. This happens when different
             # fonts are specified, and they are found in the font table
             for generic in ST_FontFamily.docx2css.values():
@@ -213,10 +220,8 @@ class UnderlineDescriptor:
         if element is not None:
             color = element.get_color()
             style = ST_Underline.css_value(element.get(w('val')))
-            value = api.TextDecoration(color=color, style=style)
-            if style != 'none':
-                value.add_line(api.TextDecoration.UNDERLINE)
-            return value
+            line = api.UNDERLINE if style != 'none' else 0
+            return api.TextDecoration(line=line, color=color, style=style)
 
     def __set__(self, instance, value: api.TextDecoration):
         raise NotImplementedError
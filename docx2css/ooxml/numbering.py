@@ -15,13 +15,15 @@ class AbstractNumbering(etree.ElementBase):
 
     @property
     def levels(self):
-        if not hasattr(self, '_levels'):
+        try:
+            return self._levels
+        except AttributeError:
             levels = {}
             for level in self.findall(w('lvl')):
                 level.abstract_numbering = self
                 levels[level.level_number] = level
-            setattr(self, '_levels', levels)
-        return getattr(self, '_levels')
+            self._levels = levels
+            return levels
 
     @property
     def multi_level_type(self):
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
+from functools import cached_property
+import io
 import logging
 import zipfile
 
@@ -29,48 +31,46 @@ class OpcPackage:
             with zipfile.ZipFile(filename) as file:
                 with file.open('[Content_Types].xml') as part_names:
                     types = etree.fromstring(part_names.read())
-                    for override in types.findall('.//{*}Override'):
-                        name = override.get('ContentType')
-                        location = override.get('PartName')[1:]
-                        self.unzip_part(file, name, location)
+                for override in types.findall('.//{*}Override'):
+                    name = override.get('ContentType')
+                    location = override.get('PartName')[1:]
+                    self.unzip_part(file, name, location)
         except FileNotFoundError:
             logger.error(f'{filename} not found. Docx has NOT been parsed!')
 
+    @staticmethod
+    def open_part(zip_file, location, buffer_size=65536):
+        """Return a buffered stream over the uncompressed part"""
+        return io.BufferedReader(zip_file.open(location), buffer_size)
+
     def unzip_part(self, zip_file, content_type, location):
         try:
-            with zip_file.open(location) as file:
-                element = etree.fromstring(file.read(), opc_parser)
+            with self.open_part(zip_file, location) as stream:
+                # Parse while inflating instead of reading the whole part
+                element = etree.parse(stream, opc_parser).getroot()
                 self.parts[content_type] = element
         except KeyError:
             pass
 
-    @property
+    @cached_property
     def font_table(self):
         return FontTable(self)
 
-    @property
+    @cached_property
     def numbering(self):
-        if not hasattr(self, '_numbering'):
-            part = NumberingPart(self, self.parts.get(CONTENT_TYPE.NUMBERING))
-            setattr(self, '_numbering', part)
-        return getattr(self, '_numbering')
+        return NumberingPart(self, self.parts.get(CONTENT_TYPE.NUMBERING))
 
-    @property
+    @cached_property
     def styles(self):
-        if not hasattr(self, '_styles'):
-            setattr(self, '_styles', Styles(self))
-        return getattr(self, '_styles')
+        return Styles(self)
 
-    @property
+    @cached_property
     def theme(self):
         return Theme(self)
 
-    @property
+    @cached_property
     def sections(self):
-        if not hasattr(self, '_sections'):
-            sections = Sections(self.parts[CONTENT_TYPE.DOCUMENT])
-            setattr(self, '_sections', sections)
-        return getattr(self, '_sections')
+        return Sections(self.parts[CONTENT_TYPE.DOCUMENT])
 
 
 class PackagePart(ABC):
@@ -18,6 +18,10 @@ from docx2css.stylesheet import Stylesheet
 
 logger = logging.getLogger(__name__)
 
+# Names of the properties parsed for each kind of style, in field order
+TEXT_PROPERTIES = tuple(f.name for f in fields(TextFormatting))
+PARAGRAPH_PROPERTIES = tuple(f.name for f in fields(ParagraphFormatting))
+
 
 class ParserFactory:
 
@@ -158,10 +162,9 @@ class DocxParser:
                 restart_add = name
                 if counter.start != 1:
                     restart_add += f' {counter.start - 1}'
-                previous.restart.add(restart_add)
+                previous.add_restart(restart_add)
 
-        props = tuple(f.name for f in fields(ParagraphFormatting))
-        self.parse_xml_style(xml_element, counter, props)
+        self.parse_xml_style(xml_element, counter, PARAGRAPH_PROPERTIES)
 
         return counter
 
@@ -174,8 +177,7 @@ class DocxParser:
 
     def parse_docx_doc_defaults(self, doc_defaults):
         style = api.BodyStyle()
-        props = tuple(x.name for x in fields(style))
-        self.parse_xml_style(doc_defaults, style, props)
+        self.parse_xml_style(doc_defaults, style, PARAGRAPH_PROPERTIES)
         self.__stylesheet.body_style = style
         return style
 
@@ -185,8 +187,7 @@ class DocxParser:
             id=docx_style.id,
             parent_id=docx_style.parent_id,
         )
-        props = tuple(f.name for f in fields(TextFormatting))
-        self.parse_xml_style(docx_style, style, props)
+        self.parse_xml_style(docx_style, style, TEXT_PROPERTIES)
         self.__stylesheet.add_style(style)
         return style
 
@@ -223,8 +224,7 @@ class DocxParser:
         style_id = self.normalize_paragraph_id(docx_style.id)
         parent_id = self.normalize_paragraph_id(docx_style.parent_id)
         style = self.get_or_create_paragraph_style(style_id, style_name, parent_id)
-        props = tuple(f.name for f in fields(ParagraphFormatting))
-        self.parse_xml_style(docx_style, style, props)
+        self.parse_xml_style(docx_style, style, PARAGRAPH_PROPERTIES)
 
         return style
 
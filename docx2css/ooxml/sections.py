@@ -1,10 +1,13 @@
 from lxml import etree
 
-from docx2css.api import PageStyle
 from docx2css.ooxml import w, wordml
 from docx2css.utils import CssUnit
 
 
+PAGE_MARGINS = w('pgMar').text
+PAGE_SIZE = w('pgSz').text
+
+
 class Sections:
 
     def __init__(self, document_part):
@@ -21,10 +24,11 @@ class MarginDescriptor:
 
     def __set_name__(self, owner, name):
         self.direction = name.partition('_')[2]
+        self.attribute = w(self.direction).text
 
     def __get__(self, instance, owner):
-        margins = instance.find(w('pgMar'))
-        return CssUnit(margins.get(w(self.direction)), 'twip')
+        margins = instance.find(PAGE_MARGINS)
+        return CssUnit(margins.get(self.attribute), 'twip')
 
     def __set__(self, instance, value):
         raise NotImplementedError
@@ -34,17 +38,22 @@ class MarginDescriptor:
 
 
 class PageSizeDescriptor:
+    attributes = {
+        'height': 'h',
+        'orientation': 'orient',
+        'width': 'w',
+    }
 
     def __set_name__(self, owner, name):
         self.property_name = name.partition('_')[2]
+        self.attribute = w(self.attributes[self.property_name]).text
 
     def __get__(self, instance, owner):
-        page_size = instance.find(w('pgSz'))
-        return {
-            'height': CssUnit(page_size.get(w('h')), 'twip'),
-            'orientation': page_size.get(w('orient')),
-            'width': CssUnit(page_size.get(w('w')), 'twip'),
-        }[self.property_name]
+        page_size = instance.find(PAGE_SIZE)
+        value = page_size.get(self.attribute)
+        if self.property_name == 'orientation':
+            return value
+        return CssUnit(value, 'twip')
 
     def __set__(self, instance, value):
         raise NotImplementedError
@@ -54,7 +63,7 @@ class PageSizeDescriptor:
 
 
 @wordml('sectPr')
-class Section(etree.ElementBase, PageStyle):
+class Section(etree.ElementBase):
 
     margin_bottom = MarginDescriptor()
     margin_left = MarginDescriptor()
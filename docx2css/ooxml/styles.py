@@ -93,11 +93,13 @@ class DocxStyle(etree.ElementBase):
 
     @property
     def children_styles(self):
-        if not hasattr(self, '_children_styles'):
+        try:
+            return self._children_styles
+        except AttributeError:
             children = [s for s in self.styles.values()
                         if s.parent_id == self.id]
-            setattr(self, '_children_styles', children)
-        return self._children_styles
+            self._children_styles = children
+            return children
 
 
 class RPrMixin:
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from docx2css.api import BodyStyle, PageStyle, BaseStyle
 
 
@@ -9,6 +11,8 @@ class Stylesheet:
         self.span_styles = dict()
         self.paragraph_styles = dict()
         self.table_styles = dict()
+        # Styles whose parent hasn't been added yet, by type and parent id
+        self._pending_children = defaultdict(list)
 
     def __get_type_dict(self, element):
         return {
@@ -22,9 +26,17 @@ class Stylesheet:
         element, _, class_name = key.partition('.')
         type_dict = self.__get_type_dict(element)
         type_dict[class_name] = style
+        for child in self._pending_children.pop((element, class_name), ()):
+            child.parent = style
+            style.add_child(child)
         if style.parent_id is not None:
             parent_key = style.parent_id
             parent = type_dict.get(parent_key, None)
             if parent:
                 style.parent = parent
-                parent.children.append(style)
+                parent.add_child(style)
+            else:
+                pending = self._pending_children[element, parent_key]
+                # A style added twice is only linked once to its parent
+                if not any(s is style for s in pending):
+                    pending.append(style)
@@ -110,7 +110,12 @@ class CSSColor:
         return '%02x%02x%02x' % (self.red, self.green, self.blue)
 
 
+def _rebuild_css_unit(cls, value):
+    return int.__new__(cls, value)
+
+
 class CssUnit(int):
+    __slots__ = ()
     _EMUS_PER_INCH = 914400
     _EMUS_PER_CM = 360000
     _EMUS_PER_MM = 36000
@@ -122,9 +127,18 @@ class CssUnit(int):
     def __new__(cls, value, unit='emu'):
         return int.__new__(cls, cls.to_emu(value, unit))
 
+    def __reduce__(self):
+        # Copies are rebuilt from the stored value. Going through __new__
+        # would convert it again, eg. multiply a Percentage by 100.
+        return _rebuild_css_unit, (type(self), int(self))
+
     @classmethod
     def to_emu(cls, value, unit):
-        if unit == 'px':
+        # Values are mostly created from other EMU values (arithmetic
+        # results), so check the no-op conversion first
+        if unit == 'emu':
+            return value
+        elif unit == 'px':
             return float(value) * float(cls._EMUS_PER_INCH) / 96
         elif unit == 'pc':
             return float(value) * float(cls._EMUS_PER_PT) * 12
@@ -138,8 +152,6 @@ class CssUnit(int):
             return float(value) * float(cls._EMUS_PER_INCH)
         elif unit == 'twip':
             return float(value) * float(cls._EMUS_PER_TWIP)
-        elif unit == 'emu':
-            return value
         else:
             raise ValueError(
                 f'{unit} is not a valid unit. '
@@ -148,31 +160,31 @@ class CssUnit(int):
 
     @property
     def px(self):
-        return self / float(self._EMUS_PER_PX)
+        return self / self._EMUS_PER_PX
 
     @property
     def pc(self):
-        return self / float(self._EMUS_PER_PC)
+        return self / self._EMUS_PER_PC
 
     @property
     def pt(self):
-        return self / float(self._EMUS_PER_PT)
+        return self / self._EMUS_PER_PT
 
     @property
     def cm(self):
-        return self / float(self._EMUS_PER_CM)
+        return self / self._EMUS_PER_CM
 
     @property
     def mm(self):
-        return self / float(self._EMUS_PER_MM)
+        return self / self._EMUS_PER_MM
 
     @property
     def inches(self):
-        return self / float(self._EMUS_PER_INCH)
+        return self / self._EMUS_PER_INCH
 
     @property
     def twips(self):
-        return int(round(self / float(self._EMUS_PER_TWIP)))
+        return int(round(self / self._EMUS_PER_TWIP))
 
     def to(self, unit):
         if unit == 'px':
@@ -192,12 +204,14 @@ class CssUnit(int):
 
 
 class AutoLength(CssUnit):
+    __slots__ = ()
 
     def __new__(cls, value=0):
         return int.__new__(cls, value)
 
 
 class Percentage(CssUnit):
+    __slots__ = ()
 
     def __new__(cls, value):
         return int.__new__(cls, value * 100)
@@ -205,3 +219,9 @@ class Percentage(CssUnit):
     @property
     def pct(self):
         return self / 100
+
+
+def css_string(text):
+    """Quote the text as a CSS string, escaping what would end it"""
+    text = text.replace('\\', '\\\\').replace('"', '\\"')
+    return '"' + text.replace('\n', '\\A ') + '"'
@@ -2,7 +2,12 @@ from unittest import TestCase
 
 import cssutils
 
-from docx2css.css.serializers import CssStylesheetSerializer, FACTORY
+from docx2css import api
+from docx2css.css.serializers import (
+    CounterSerializer,
+    CssStylesheetSerializer,
+    FACTORY,
+)
 from docx2css.ooxml.numbering import AbstractNumbering
 from docx2css.ooxml.package import OpcPackage
 from docx2css.ooxml.parsers import DocxParser
@@ -198,6 +203,30 @@ class CounterContentTestCase(TestCase):
         expected = {'start-at-5-list-L0'}
         self.assertEqual(expected, result)
 
+    def counter_content(self, text, suffix='tab'):
+        counter_list = api.CounterList(id=1, name='list')
+        counter = api.Counter(counter_list=counter_list, name='list-L0',
+                              text=text, suffix=suffix)
+        counter_list.counters[counter.name] = counter
+        return CounterSerializer(None, counter).css_counter_content()
+
+    def test_counter_content_literal(self):
+        self.assertEqual('"-"', self.counter_content('-'))
+        self.assertEqual(r'"\005C 00A0"', self.counter_content('', 'space'))
+
+    def test_counter_content_single_reference(self):
+        self.assertEqual('counter(list-L0, decimal)',
+                         self.counter_content('{list-L0}'))
+
+    def test_counter_content_mixed(self):
+        self.assertEqual('"(" counter(list-L0, decimal) ")"',
+                         self.counter_content('({list-L0})'))
+
+    def test_counter_content_escaped(self):
+        self.assertEqual(r'"\"" counter(list-L0, decimal)',
+                         self.counter_content('"{list-L0}'))
+        self.assertEqual(r'"a\\b"', self.counter_content('a\\b'))
+
 
 class ParagraphNumberingParserTestCase(TestCase):
 
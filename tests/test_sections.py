@@ -79,3 +79,11 @@ class PageSizeSerializerTestCase(TestCase):
     def test_css_print_legal(self):
         self.compare_style('test_files/sections/docx/legal_landscape.docx',
                            'test_files/sections/css/legal_landscape_print.css')
+
+    def test_css_print_only(self):
+        style = get_page_style('test_files/numbering/docx/requete.docx')
+        serializer = FACTORY.get_block_serializer(style)
+        serializer.include_screen_rules = False
+        rules = list(serializer.css_style_rules())
+        self.assertEqual(1, len(rules))
+        self.assertTrue(rules[0].startswith('@page'))
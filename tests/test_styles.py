@@ -5,10 +5,19 @@ import warnings
 import cssutils
 from lxml import etree
 
-from docx2css.css.serializers import FACTORY, CssStylesheetSerializer
+import docx2css
+from docx2css import api
+from docx2css.api import SpanStyle, TextDecoration
+from docx2css.css.serializers import (
+    FACTORY,
+    BackgroundColorSerializer,
+    CssDeclaration,
+    CssStylesheetSerializer,
+)
 from docx2css.ooxml.package import OpcPackage
 from docx2css.ooxml.styles import Styles
 from docx2css.ooxml.parsers import DocxParser
+from docx2css.stylesheet import Stylesheet
 from docx2css.utils import CSSColor, CssUnit
 
 
@@ -149,6 +158,164 @@ class StylesTestCase(TestCase):
 
         self.assertEqual(2, len(api_parent.children))
 
+    def test_add_child_before_parent(self):
+        stylesheet = Stylesheet()
+        child = SpanStyle(name='child', id='child', parent_id='parent')
+        parent = SpanStyle(name='parent', id='parent')
+        stylesheet.add_style(child)
+        stylesheet.add_style(parent)
+        self.assertIs(parent, child.parent)
+        self.assertEqual([child], parent.children)
+
+    def test_add_child_twice_before_parent(self):
+        stylesheet = Stylesheet()
+        child = SpanStyle(name='child', id='child', parent_id='parent')
+        parent = SpanStyle(name='parent', id='parent')
+        stylesheet.add_style(child)
+        stylesheet.add_style(child)
+        stylesheet.add_style(parent)
+        self.assertEqual([child], parent.children)
+        serializer = FACTORY.get_block_serializer(parent)
+        self.assertEqual('span.parent , span.child ', serializer.css_selector())
+
+
+class ApiSlotsTestCase(TestCase):
+
+    def test_no_instance_dict(self):
+        instances = (
+            api.Border(),
+            api.TextDecoration(),
+            api.TextFormatting(),
+            api.ParagraphFormatting(),
+            api.TableRowProperties(),
+            api.TableCellProperties(),
+            api.TableConditionalFormatting(),
+            api.BodyStyle(),
+            api.SpanStyle(name='span', id='span'),
+            api.ParagraphStyle(name='p', id='p'),
+            api.TableStyle(name='table', id='table'),
+            api.CounterList(id=1, name='list'),
+            api.Counter(),
+            api.PageStyle(),
+        )
+        for instance in instances:
+            with self.subTest(type(instance).__name__):
+                self.assertFalse(hasattr(instance, '__dict__'))
+
+
+class TextDecorationTestCase(TestCase):
+
+    def test_with_line_twice(self):
+        decoration = TextDecoration()
+        decoration = decoration.with_line(TextDecoration.UNDERLINE)
+        decoration = decoration.with_line(TextDecoration.UNDERLINE)
+        self.assertTrue(decoration.has_line(TextDecoration.UNDERLINE))
+        self.assertFalse(decoration.has_line(TextDecoration.LINE_THROUGH))
+
+    def test_without_line(self):
+        decoration = TextDecoration()
+        decoration = decoration.with_line(TextDecoration.UNDERLINE)
+        decoration = decoration.with_line(TextDecoration.LINE_THROUGH)
+        decoration = decoration.without_line(TextDecoration.UNDERLINE)
+        self.assertFalse(decoration.has_line(TextDecoration.UNDERLINE))
+        self.assertTrue(decoration.has_line(TextDecoration.LINE_THROUGH))
+
+    def test_frozen(self):
+        decoration = TextDecoration()
+        self.assertEqual(decoration, decoration.with_line(0))
+        self.assertEqual(hash(decoration), hash(TextDecoration()))
+        with self.assertRaises(AttributeError):
+            decoration.line = TextDecoration.UNDERLINE
+
+
+class CssDeclarationTestCase(TestCase):
+
+    def test_missing_property(self):
+        self.assertEqual('', CssDeclaration()['color'])
+
+    def test_empty_value_removes_property(self):
+        declaration = CssDeclaration()
+        declaration['color'] = 'red'
+        declaration['margin-left'] = '1in'
+        declaration['color'] = ''
+        declaration['margin-left'] = None
+        self.assertEqual({}, declaration)
+
+    def test_css_text(self):
+        declaration = CssDeclaration()
+        declaration['color'] = 'red'
+        declaration['margin-left'] = '1in'
+        declaration['color'] = 'blue'
+        self.assertEqual('color: blue; margin-left: 1in', declaration.css_text)
+
+    def test_prepend(self):
+        declaration = CssDeclaration()
+        declaration['padding'] = '1pt'
+        declaration['border-style'] = 'solid'
+        declaration.prepend(
+            ('border-collapse', 'collapse'),
+            ('border-style', 'hidden'),
+        )
+        self.assertEqual(
+            'border-collapse: collapse; border-style: solid; padding: 1pt',
+            declaration.css_text
+        )
+
+
+class BackgroundColorSerializerTestCase(TestCase):
+
+    def test_existing_color_is_kept(self):
+        declaration = CssDeclaration()
+        declaration['background-color'] = '#00FF00'
+        BackgroundColorSerializer(None, '#FF0000').set_css_style(declaration)
+        self.assertEqual('#00FF00', declaration['background-color'])
+
+    def test_unset_color_is_replaced(self):
+        declaration = CssDeclaration()
+        declaration['background-color'] = 'unset'
+        BackgroundColorSerializer(None, '#FF0000').set_css_style(declaration)
+        self.assertEqual('#FF0000', declaration['background-color'])
+
+    def test_no_color(self):
+        declaration = CssDeclaration()
+        BackgroundColorSerializer(None, None).set_css_style(declaration)
+        self.assertEqual('unset', declaration['background-color'])
+
+
+class ChildSerializersTestCase(TestCase):
+
+    def setUp(self):
+        self.stylesheet = Stylesheet()
+        self.stylesheet.add_style(SpanStyle(id='a', name='a'))
+        self.stylesheet.add_style(SpanStyle(id='b', name='b', parent_id='a'))
+        self.parent = self.stylesheet.span_styles['a']
+        self.child = self.stylesheet.span_styles['b']
+
+    def test_block_serializers_are_not_shared(self):
+        self.assertIsNot(
+            FACTORY.get_block_serializer(self.parent),
+            FACTORY.get_block_serializer(self.parent),
+        )
+
+    def test_child_serializers_are_shared(self):
+        serializer = FACTORY.get_block_serializer(self.parent)
+        child_serializer = serializer.get_child_serializer(self.child)
+        self.assertIs(
+            child_serializer, serializer.get_child_serializer(self.child)
+        )
+        self.assertIs(
+            serializer.child_serializers, child_serializer.child_serializers
+        )
+
+    def test_new_descendant_is_selected(self):
+        serializer = FACTORY.get_block_serializer(self.parent)
+        self.assertEqual('span.a , span.b ', serializer.css_selector())
+        self.stylesheet.add_style(SpanStyle(id='c', name='c', parent_id='b'))
+        serializer = FACTORY.get_block_serializer(self.parent)
+        self.assertEqual(
+            'span.a , span.b , span.c ', serializer.css_selector()
+        )
+
 
 class CharacterStylesTestCase(TestHarness):
     files = (
@@ -858,6 +1025,54 @@ class RequeteTestCase(TestCase):
         with open(expected_css, mode='r', encoding='utf-8') as expected:
             self.assertEqual(expected.read(), css)
 
+    def test_serialize_without_normalization(self):
+        parser = DocxParser('test_files/endos.docx')
+        serializer = CssStylesheetSerializer(parser.parse())
+        expected = serializer.serialize()
+        serializer.normalize_css = False
+        css = serializer.serialize()
+        self.assertNotEqual(expected, css)
+        stylesheet = cssutils.parseString(css)
+        self.assertEqual(expected, stylesheet.cssText.decode('utf-8'))
+
+    def test_css_stylesheet(self):
+        parser = DocxParser('test_files/endos.docx')
+        serializer = CssStylesheetSerializer(parser.parse())
+        stylesheet = serializer.css_stylesheet
+        self.assertIsInstance(stylesheet, cssutils.css.CSSStyleSheet)
+        self.assertEqual(
+            serializer.serialize(), stylesheet.cssText.decode('utf-8')
+        )
+
+    def test_bad_value_keeps_following_rules(self):
+        stylesheet = Stylesheet()
+        for i, font in enumerate(('Foo}Bar', 'Arial', 'Times')):
+            stylesheet.add_style(
+                SpanStyle(id=f'span{i}', name=f'span{i}', font_family=font)
+            )
+        serializer = CssStylesheetSerializer(stylesheet)
+        serializer.include_media_rules = False
+        css = serializer.serialize()
+        for i in range(3):
+            self.assertIn(f'span.span{i} {{', css)
+        self.assertIn('font-family: Times', css)
+
+    def test_quoted_counter_text(self):
+        stylesheet = Stylesheet()
+        counter_list = api.CounterList(id=1, name='list')
+        counter = api.Counter(counter_list=counter_list, name='list-L0',
+                              text='"{list-L0}')
+        counter_list.counters[counter.name] = counter
+        stylesheet.add_style(
+            api.ParagraphStyle(id='list', name='list', counter=counter)
+        )
+        stylesheet.add_style(SpanStyle(id='span', name='span', bold=True))
+        serializer = CssStylesheetSerializer(stylesheet)
+        serializer.include_media_rules = False
+        css = serializer.serialize()
+        self.assertIn('content: "\\"" counter(list-L0, decimal)', css)
+        self.assertIn('span.span {', css)
+
     def test_endos(self):
         self.compare_documents('test_files/endos.docx',
                                'test_files/endos.css')
@@ -907,6 +1122,34 @@ class RequeteTestCase(TestCase):
         expected = 'p.no-space, p.no-space-center-bold'
         self.assertEqual(expected, block_serializer.css_selector())
 
+    def test_serializer_is_exported(self):
+        self.assertIs(CssStylesheetSerializer,
+                      docx2css.CssStylesheetSerializer)
+        from docx2css import CssStylesheetSerializer as serializer_class
+        self.assertIs(CssStylesheetSerializer, serializer_class)
+        with self.assertRaises(AttributeError):
+            docx2css.NotAName
+
+    def test_open_docx_is_cached(self):
+        filename = 'test_files/numbering/docx/requete.docx'
+        docx2css.open_docx(filename)
+        hits = docx2css._open_cached_docx.cache_info().hits
+        docx2css.open_docx(f'../tests/{filename}')
+        self.assertEqual(hits + 1, docx2css._open_cached_docx.cache_info().hits)
+
+    def test_open_docx_returns_a_copy(self):
+        filename = 'test_files/numbering/docx/requete.docx'
+        stylesheet = docx2css.open_docx(filename)
+        stylesheet.body_style.counter = api.Counter(text='')
+        self.assertIsNot(stylesheet, docx2css.open_docx(filename))
+        self.assertIsNone(docx2css.open_docx(filename).body_style.counter)
+
+    def test_to_string_leaves_the_stylesheet_untouched(self):
+        filename = 'test_files/numbering/docx/requete.docx'
+        stylesheet = docx2css.open_docx(filename)
+        docx2css.to_string(stylesheet)
+        self.assertIsNone(stylesheet.body_style.counter)
+
 
 class CharacterStylesParserTestCase(TestCase):
     files = (
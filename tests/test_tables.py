@@ -1,3 +1,4 @@
+import copy
 import logging
 from unittest import TestCase
 
@@ -158,6 +159,11 @@ class TestTableProperties(TestCase):
         self.assertEqual('solid', style.border_inside_vertical.style)
         self.assertIsNone(style.border_inside_vertical.color)
 
+    def test_table_border_equal_borders_are_shared(self):
+        style = self.styles['table-borders-inside']
+        self.assertIs(style.border_inside_horizontal,
+                      style.border_inside_vertical)
+
     def test_table_border_left_none(self):
         style = self.styles['table-borders-inside']
         docx_style = self.xml_elements[style.name]
@@ -1789,3 +1795,17 @@ class TestCssTableConditionalFormatting(CssSerializerTestHarness):
         name = 'table-bottom-right-cell-border-inside'
         style = self.styles[name]
         self.compare_style(style, f'{name}.css')
+
+
+class TableStyleCopyTestCase(TestCase):
+
+    def test_deepcopy_keeps_percentage_width(self):
+        name = 'table-width-50pct'
+        stylesheet = Stylesheet()
+        stylesheet.add_style(TableStyle(id=name, name=name,
+                                        width=Percentage(50)))
+        stylesheet = copy.deepcopy(stylesheet)
+        self.assertEqual(50, stylesheet.table_styles[name].width.pct)
+        serializer = CssStylesheetSerializer(stylesheet)
+        serializer.include_media_rules = False
+        self.assertIn('width: 50%', serializer.serialize())
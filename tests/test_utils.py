@@ -1,6 +1,14 @@
+import copy
+import pickle
 from unittest import TestCase
 
-from docx2css.utils import CSSColor, CssUnit
+from docx2css.utils import (
+    AutoLength,
+    CSSColor,
+    CssUnit,
+    Percentage,
+    css_string,
+)
 
 
 class CSSColorTestCase(TestCase):
@@ -141,3 +149,28 @@ class CssUnitTestCase(TestCase):
 
     def test_twips(self):
         self.assertEqual(1, CssUnit(1, 'twip').twips)
+
+
+class CssStringTestCase(TestCase):
+
+    def test_plain_text(self):
+        self.assertEqual('"Times New Roman"', css_string('Times New Roman'))
+
+    def test_escaped_text(self):
+        self.assertEqual(r'"Say \"hi\""', css_string('Say "hi"'))
+        self.assertEqual(r'"a\\b"', css_string('a\\b'))
+        self.assertEqual(r'"a\A b"', css_string('a\nb'))
+
+
+class CssUnitCopyTestCase(TestCase):
+
+    def test_copies_keep_the_value(self):
+        for unit in (CssUnit(2, 'pt'), AutoLength(), Percentage(50)):
+            for result in (copy.deepcopy(unit),
+                           pickle.loads(pickle.dumps(unit))):
+                with self.subTest(type(unit).__name__):
+                    self.assertIs(type(unit), type(result))
+                    self.assertEqual(int(unit), int(result))
+
+    def test_copied_percentage(self):
+        self.assertEqual(50, copy.deepcopy(Percentage(50)).pct)